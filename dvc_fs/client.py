@@ -3,15 +3,22 @@ High-level DVC client for building aced workflows.
 
 @Piotr Styczyński 2021
 """
+import asyncio
+import atexit
 import datetime
+import functools
+import hashlib
 import io
 import os
 import pathlib
 import shutil
+import sys
 import tempfile
+import threading
 import time
-from dataclasses import dataclass
-from typing import Any, List, Optional, TextIO, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Set, TextIO, Tuple
 
 from git import Repo, exc
 
@@ -31,7 +38,7 @@ except ImportError:
     from io import StringIO  # # for Python 3
 
 
-@dataclass
+@dataclass(frozen=True)
 class DVCCommit:
     """
     Information about the commit created by the DVC operators
@@ -56,6 +63,9 @@ class ClonedRepo:
     temp_dir: tempfile.TemporaryDirectory  # Temporary directory object pointing to the clone path
     repo: Repo  # Git repo handler
     dvc: DVCLocalCli  # DVC interface
+    # Path prefixes materialized via git sparse-checkout
+    # (empty set means the full working tree is checked out)
+    sparse_paths: Set[str] = field(default_factory=set)
 
 
 EXCLUDED_GIT_SEARCH_DIRECTORIES = [
@@ -63,21 +73,182 @@ EXCLUDED_GIT_SEARCH_DIRECTORIES = [
     ".dvc",
 ]
 
+# Suffix of the DVC metadata files tracked in the repo
+DVC_FILE_SUFFIX = ".dvc"
+DVC_FILE_SUFFIX_LEN = len(DVC_FILE_SUFFIX)
+
+# scan_dir interns entry names up to this length so repeated scans of
+# the same tree reuse one string object per name instead of allocating
+# a fresh copy each time (longer names are too rare to be worth it)
+INTERNED_NAME_MAX_LENGTH = 64
+
+# Files whose .dvc metafile records at least this size (in bytes) are
+# pulled on the large-file lane (see Client.download)
+LARGE_DOWNLOAD_THRESHOLD = 8 * 1024 * 1024
+
+
+def _metafile_size(metafile_path: str) -> int:
+    """
+    Read the file size recorded in a .dvc metadata file.
+    The metafiles are tiny YAML documents, so a plain line scan for the
+    'size:' entry is enough and avoids a YAML parse per file.
+    :param metafile_path: Path to the .dvc metadata file
+    :returns: Recorded size in bytes, or 0 when none is recorded
+    """
+    try:
+        with open(metafile_path, "r") as metafile:
+            for line in metafile:
+                stripped = line.strip()
+                if stripped.startswith("size:"):
+                    return int(stripped[len("size:"):])
+    except (OSError, ValueError):
+        pass
+    return 0
+
+# Default location of the persistent bare-mirror cache used to speed up
+# repeated clones of the same DVC repo (see clone_repo)
+DEFAULT_MIRROR_CACHE_DIR = os.path.join(
+    os.path.expanduser("~"), ".cache", "dvc_fs", "mirrors"
+)
+
+_MIRROR_CACHE: Dict[str, str] = {}
+_MIRROR_CACHE_LOCK = threading.Lock()
+
+# Process-lifetime clones shared between Client instances of the same
+# repository URL (see Client._ensure_repo)
+_SHARED_REPO_CACHE: Dict[str, "ClonedRepo"] = {}
+_SHARED_REPO_LOCKS: Dict[str, threading.RLock] = {}
+_SHARED_REPO_CACHE_LOCK = threading.Lock()
+
+
+def _shared_repo_lock(dvc_repo: str) -> threading.RLock:
+    """
+    Return the lock serializing use of the shared clone of the given
+    repository URL, creating it on first use.
+    Clients sharing one clone use this lock as their repo lock, so
+    operations issued by different instances cannot interleave on the
+    shared working tree (refresh-and-adopt, pulls, adds and commits).
+    :param dvc_repo: Repository clone URL
+    :returns: Process-wide lock for that repository URL
+    """
+    with _SHARED_REPO_CACHE_LOCK:
+        lock = _SHARED_REPO_LOCKS.get(dvc_repo)
+        if lock is None:
+            lock = threading.RLock()
+            _SHARED_REPO_LOCKS[dvc_repo] = lock
+        return lock
+
+
+def _refresh_cloned_repo(cloned_repo: ClonedRepo) -> None:
+    """
+    Bring a reused clone back in sync with its remote.
+    Adopters of a shared clone must see the current repository state,
+    not the state at clone time.
+    :param cloned_repo: Cloned repo access object
+    """
+    cloned_repo.repo.remotes.origin.fetch()
+    cloned_repo.repo.git.reset("--hard", "@{upstream}")
+
+
+def _cleanup_shared_repos():
+    """
+    Remove the clones shared between Client instances.
+    Registered with atexit so the temporary directories do not outlive
+    the process.
+    """
+    with _SHARED_REPO_CACHE_LOCK:
+        for cloned_repo in _SHARED_REPO_CACHE.values():
+            try:
+                cloned_repo.temp_dir.cleanup()
+            except OSError:
+                pass
+        _SHARED_REPO_CACHE.clear()
+
+
+atexit.register(_cleanup_shared_repos)
+
+
+def _get_repo_mirror(dvc_repo: str, mirror_cache: str) -> str:
+    """
+    Return a path to an up-to-date bare mirror of the given repository,
+    creating it on first use. Mirrors persist across Client instances
+    (and processes) so that subsequent clones are local object copies
+    instead of full network transfers.
+    :param dvc_repo: Repository clone URL
+    :param mirror_cache: Directory where mirrors are stored
+    :returns: Path to the bare mirror
+    """
+    with _MIRROR_CACHE_LOCK:
+        mirror_path = _MIRROR_CACHE.get(dvc_repo)
+        if mirror_path is None:
+            repo_digest = hashlib.sha256(dvc_repo.encode()).hexdigest()[:16]
+            mirror_path = os.path.join(mirror_cache, f"{repo_digest}.git")
+        if os.path.isdir(mirror_path):
+            Repo(mirror_path).git.remote("update", "--prune")
+        else:
+            os.makedirs(mirror_cache, exist_ok=True)
+            mirror_repo = Repo.clone_from(
+                dvc_repo, mirror_path, multi_options=["--mirror"]
+            )
+            # Working clones reference the mirror through --shared
+            # alternates; a gc triggered here by a later remote update
+            # could delete objects a live clone still needs, so auto-gc
+            # must never run in the mirror
+            mirror_repo.git.config("gc.auto", "0")
+        _MIRROR_CACHE[dvc_repo] = mirror_path
+        return mirror_path
+
+
+def ensure_sparse_path(
+    cloned_repo: ClonedRepo,
+    path_prefix: Optional[str],
+) -> None:
+    """
+    Make sure the given path prefix is present in the working tree
+    of a (possibly sparse) clone.
+    :param cloned_repo: Cloned repo access object
+    :param path_prefix: Required directory prefix inside the repo.
+        None means the full working tree is required.
+    """
+    if not cloned_repo.sparse_paths:
+        # Full (non-sparse) checkout covers everything
+        return
+    if path_prefix is None:
+        cloned_repo.repo.git.sparse_checkout("disable")
+        cloned_repo.sparse_paths.clear()
+    elif path_prefix not in cloned_repo.sparse_paths:
+        cloned_repo.repo.git.sparse_checkout("add", path_prefix)
+        cloned_repo.sparse_paths.add(path_prefix)
+
 
 def clone_repo(
     dvc_repo: str,
     temp_path: Optional[str] = None,
     existing_file_path:Optional[str]=None,
     repo: Optional[ClonedRepo] = None,
+    path_prefix: Optional[str] = None,
+    mirror_cache: Optional[str] = None,
 ) -> ClonedRepo:
     """
     Clone GIT repo configured for DVC.
+    The clone is blobless (--filter=blob:none) so only the commit/tree
+    metadata is transferred eagerly and file contents are fetched on demand.
+    When path_prefix is given only that subtree is checked out
+    (git sparse-checkout) instead of the whole working tree.
+    When mirror_cache is given remote repositories are cloned through
+    a persistent local bare mirror (git clone --reference --shared)
+    so that only the first clone in the cache lifetime pays the
+    network cost.
     :param dvc_repo: Repository clone URL
     :param temp_path: Optional temporary path to store fetched data
+    :param path_prefix: Optional directory prefix to restrict the checkout to
+    :param mirror_cache: Optional directory with persistent repo mirrors
     :returns: Cloned repo access object
     """
+    if path_prefix in ("", "."):
+        path_prefix = None
     if existing_file_path and os.path.exists(existing_file_path):
-        dvc = DVCLocalCli(clone_path)
+        dvc = DVCLocalCli(existing_file_path)
         return ClonedRepo(
             clone_path=existing_file_path,
             temp_dir=tempfile.TemporaryDirectory(dir=existing_file_path,delete=False),
@@ -86,6 +257,7 @@ def clone_repo(
         )
     else:
         if repo is not None:
+            ensure_sparse_path(repo, path_prefix)
             return repo
         if temp_path is None:
             temp_dir = tempfile.TemporaryDirectory()
@@ -95,16 +267,47 @@ def clone_repo(
         if os.path.isdir(clone_path):
             shutil.rmtree(clone_path)
         os.makedirs(clone_path, exist_ok=True)
+        clone_source = dvc_repo
+        if mirror_cache is not None and not os.path.exists(dvc_repo):
+            # Local paths are already cheap to clone - mirror only remotes
+            try:
+                clone_source = _get_repo_mirror(dvc_repo, mirror_cache)
+            except exc.GitError as e:
+                raise DVCGitRepoNotAccessibleError(dvc_repo, e)
+        clone_options = ["--filter=blob:none"]
+        if clone_source is not dvc_repo:
+            clone_options += [
+                "--reference", clone_source, "--shared",
+            ]
+        if path_prefix is not None:
+            clone_options.append("--no-checkout")
         try:
-            repo = Repo.clone_from(dvc_repo, clone_path)
+            repo = Repo.clone_from(
+                clone_source, clone_path, multi_options=clone_options
+            )
         except exc.GitError as e:
             raise DVCGitRepoNotAccessibleError(dvc_repo, e)
+        if clone_source is not dvc_repo:
+            # Point origin back at the real remote so that pushes and
+            # on-demand blob fetches bypass the mirror
+            repo.git.remote("set-url", "origin", dvc_repo)
+        sparse_paths: Set[str] = set()
+        if path_prefix is not None:
+            repo.git.sparse_checkout("init", "--cone")
+            # Cone mode excludes top-level directories that are not part
+            # of the set, so .dvc (DVC config and remote definitions)
+            # must be listed explicitly or no DVC command will run in
+            # the clone
+            repo.git.sparse_checkout("set", ".dvc", path_prefix)
+            repo.git.checkout()
+            sparse_paths.add(path_prefix)
         dvc = DVCLocalCli(clone_path)
         return ClonedRepo(
             clone_path=clone_path,
             temp_dir=temp_dir,
             repo=repo,
             dvc=dvc,
+            sparse_paths=sparse_paths,
         )
 
 
@@ -127,31 +330,59 @@ def dvc_open_clone(
     :returns: Descriptor to the file contents
     """
     repo_url = repo
-    client._repo_cache = clone_repo(repo,existing_file_path=existing_file_path, repo=client._repo_cache)
-    if not os.path.isfile(
-        os.path.join(client._repo_cache.clone_path, f"{path}.dvc")
-    ):
-        if empty_fallback:
-            if is_binary:
-                return io.BytesIO()
-            return io.StringIO()
-        raise DVCFileMissingError(repo_url, path)
-    # Pull the file
-    client._repo_cache.dvc.pull_path(path)
-    if not os.path.isfile(os.path.join(client._repo_cache.clone_path, path)):
-        if empty_fallback:
-            if is_binary:
-                return io.BytesIO()
-            return io.StringIO()
-        raise DVCFileMissingError(repo_url, path)
-    with open(
-        os.path.join(client._repo_cache.clone_path, path), ("r" if not is_binary else "rb")
-    ) as dvc_file:
-        if is_binary:
-            input_stream = io.BytesIO(dvc_file.read())
-        else:
-            input_stream = io.StringIO(dvc_file.read())
-    return input_stream
+    # Serialized with all other operations on a (possibly shared) clone
+    with client._repo_lock:
+        client._repo_cache = clone_repo(
+            repo,
+            existing_file_path=existing_file_path,
+            repo=client._repo_cache,
+            path_prefix=os.path.dirname(path),
+            mirror_cache=client.mirror_cache,
+        )
+        if not os.path.isfile(
+            os.path.join(client._repo_cache.clone_path, f"{path}.dvc")
+        ):
+            if empty_fallback:
+                if is_binary:
+                    return io.BytesIO()
+                return io.StringIO()
+            raise DVCFileMissingError(repo_url, path)
+        # Pull the file
+        client._repo_cache.dvc.pull_path(path)
+        try:
+            # Return the file handle directly instead of copying the whole
+            # content into an in-memory buffer first
+            return open(
+                os.path.join(client._repo_cache.clone_path, path),
+                ("r" if not is_binary else "rb"),
+            )
+        except FileNotFoundError:
+            if empty_fallback:
+                if is_binary:
+                    return io.BytesIO()
+                return io.StringIO()
+            raise DVCFileMissingError(repo_url, path)
+
+
+class _OpenedFileContext:
+    """
+    File-like context that keeps the context manager a descriptor was
+    obtained from alive for as long as the descriptor is in use.
+    dvc.api.open returns a generator-based context manager whose
+    suspended generator closes the yielded file (and tears down the
+    repo) as soon as the object is garbage collected, so the entered
+    descriptor must never outlive it.
+    """
+
+    def __init__(self, fd_context, fd):
+        self._fd_context = fd_context
+        self._fd = fd
+
+    def __enter__(self):
+        return self._fd
+
+    def __exit__(self, type, value, traceback):
+        return self._fd_context.__exit__(type, value, traceback)
 
 
 try:
@@ -175,18 +406,20 @@ try:
           Otherwise function throws dvc_fs.exceptions.DVCFileMissingError
         :returns: Descriptor to the file contents
         """
+        LOGS.dvc_hook.info(dvc_api_version)
+        # dvc.api.open defers validation until the context is entered,
+        # so enter it here: one call both checks that the file exists
+        # and opens the stream (previously dvc.api.get_url performed a
+        # separate pre-check round-trip before every open)
+        fd_context = dvc_fs.open(
+            path,
+            repo=repo,
+            mode="r" if not is_binary else "rb",
+        )
         try:
-            # Url will fail if the file is missing
-            LOGS.dvc_hook.info(dvc_api_version)
-            dvc.api.get_url(
-                path,
-                repo=repo,
-            )
-            return dvc_fs.open(
-                path,
-                repo=repo,
-                mode="r" if not is_binary else "rb",
-            )
+            # The context manager object must stay referenced, otherwise
+            # its finalizer closes the descriptor it just yielded
+            return _OpenedFileContext(fd_context, fd_context.__enter__())
         except CloneError as err:
             return dvc_open_clone(
                         repo=repo,
@@ -227,14 +460,14 @@ def repo_add_dvc_files(
         If the flag is set to False adds files to commit for update.
     """
     dvc_files = [f"{file}.dvc" for file in files]
-    for dvc_file in dvc_files:
-        if not delete_mode:
-            repo.index.add([dvc_file])
-        else:
-            repo.index.remove([dvc_file])
+    # Stage all files with one index operation instead of one per file
+    if not delete_mode:
+        repo.index.add(dvc_files)
+    else:
+        repo.index.remove(dvc_files)
 
 
-@dataclass
+@dataclass(frozen=True)
 class DVCEntryMetadata:
     path: str
     name: str
@@ -300,24 +533,30 @@ class DVCFile:
                     is_binary=self.mode in ["rb", "rb+"],
                 )
             else:
-                self.client._repo_cache = clone_repo(
-                    self.dvc_repo, repo=self.client._repo_cache
-                )
-                if os.path.isfile(
-                    os.path.join(
-                        self.client._repo_cache.clone_path, f"{self.path}.dvc"
+                # Serialized with all other operations on a (possibly
+                # shared) clone
+                with self.client._repo_lock:
+                    self.client._ensure_repo(
+                        path_prefix=os.path.dirname(self.path)
                     )
-                ):
-                    # Pull the file
-                    self.client._repo_cache.dvc.pull_path(self.path)
-                self._tmp_path = os.path.join(
-                    self.client._repo_cache.clone_path, self.path
-                )
-                pathlib.Path(
-                    os.path.dirname(os.path.abspath(self._tmp_path))
-                ).mkdir(parents=True, exist_ok=True)
-                self.descriptor = open(self._tmp_path, self.mode).__enter__()
-                return self.descriptor
+                    if os.path.isfile(
+                        os.path.join(
+                            self.client._repo_cache.clone_path,
+                            f"{self.path}.dvc",
+                        )
+                    ):
+                        # Pull the file
+                        self.client._repo_cache.dvc.pull_path(self.path)
+                    self._tmp_path = os.path.join(
+                        self.client._repo_cache.clone_path, self.path
+                    )
+                    pathlib.Path(
+                        os.path.dirname(os.path.abspath(self._tmp_path))
+                    ).mkdir(parents=True, exist_ok=True)
+                    self.descriptor = open(
+                        self._tmp_path, self.mode
+                    ).__enter__()
+                    return self.descriptor
         return self.descriptor.__enter__()
 
     def __exit__(self, type, value, traceback):
@@ -347,19 +586,115 @@ class Client:
         dvc_repo: str,
         temp_path: Optional[str] = None,
         clone_branch:Optional[str]=None,
+        mirror_cache: Optional[str] = DEFAULT_MIRROR_CACHE_DIR,
+        jobs: Optional[int] = None,
     ):
         """
         :param dvc_repo: Clone URL for the GIT repo that has DVC configured
+        :param mirror_cache: Directory with persistent repo mirrors used to
+          speed up repeated clones (pass None to always clone directly
+          from the remote)
+        :param jobs: Number of worker threads used for bulk downloads
         """
         super().__init__()
-        self.dvc_repo = dvc_repo
+        # Interned so every DVCEntryMetadata/DVCFile carrying the repo
+        # URL shares one string object (and the shared-cache dict lookups
+        # hit the pointer-equality fast path)
+        self.dvc_repo = sys.intern(dvc_repo)
         self.temp_path = temp_path
+        self.mirror_cache = mirror_cache
+        if jobs is None:
+            jobs = min(8, (os.cpu_count() or 4) * 2)
+        self.jobs = jobs
+        # Clients without an explicit temp_path share the per-URL clone,
+        # so they must also share the lock that serializes work on it;
+        # clients with a private clone get a private lock
+        if temp_path is None:
+            self._repo_lock = _shared_repo_lock(self.dvc_repo)
+        else:
+            self._repo_lock = threading.RLock()
+
+    def _ensure_repo(self, path_prefix: Optional[str] = None) -> ClonedRepo:
+        """
+        Return the cached repo clone, creating it on first use.
+        Cloning is deferred until an operation actually needs the repo,
+        so constructing a Client stays free of any network traffic.
+
+        Clients without an explicit temp_path share one clone per
+        repository URL for the lifetime of the process, so repeated
+        Client constructions do not re-pay the clone cost. An adopted
+        shared clone is fetched and reset first so this client sees the
+        current remote state, as a fresh clone would.
+
+        :param path_prefix: Optional directory prefix that has to be
+          present in the working tree (see clone_repo)
+        :returns: Cloned repo access object
+        """
+        with self._repo_lock:
+            if self._repo_cache is None and self.temp_path is None:
+                with _SHARED_REPO_CACHE_LOCK:
+                    shared_repo = _SHARED_REPO_CACHE.get(self.dvc_repo)
+                if shared_repo is not None:
+                    try:
+                        _refresh_cloned_repo(shared_repo)
+                        self._repo_cache = shared_repo
+                    except exc.GitError:
+                        # Unusable shared clone - evict it and fall back
+                        # to a fresh clone below
+                        with _SHARED_REPO_CACHE_LOCK:
+                            if (
+                                _SHARED_REPO_CACHE.get(self.dvc_repo)
+                                is shared_repo
+                            ):
+                                del _SHARED_REPO_CACHE[self.dvc_repo]
+            self._repo_cache = clone_repo(
+                self.dvc_repo,
+                self.temp_path,
+                repo=self._repo_cache,
+                path_prefix=path_prefix,
+                mirror_cache=self.mirror_cache,
+            )
+            if self.temp_path is None:
+                with _SHARED_REPO_CACHE_LOCK:
+                    _SHARED_REPO_CACHE.setdefault(
+                        self.dvc_repo, self._repo_cache
+                    )
+            return self._repo_cache
+
+    def __enter__(self) -> "Client":
+        """
+        Enter the client context.
+        The repo clone is still created lazily on first use;
+        __exit__ removes it so no temporary clone outlives the context.
+        """
+        return self
+
+    def __exit__(self, type, value, traceback):
+        """
+        Leave the client context and clean up the cached clone
+        """
+        self.cleanup()
 
     def cleanup(self):
         LOGS.dvc_hook.info("Perform cleanup")
-        if self._repo_cache is not None:
-            self._repo_cache.temp_dir.cleanup()
-            self._repo_cache = None
+        # Taken under the repo lock so cleanup cannot interleave with a
+        # concurrent _ensure_repo (and a second cleanup becomes a no-op)
+        with self._repo_lock:
+            if self._repo_cache is not None:
+                with _SHARED_REPO_CACHE_LOCK:
+                    is_shared = (
+                        _SHARED_REPO_CACHE.get(self.dvc_repo)
+                        is self._repo_cache
+                    )
+                    if is_shared:
+                        # Evict the shared entry so the next operation
+                        # starts from a fresh clone; the temporary
+                        # directory is removed by its own finalizer once
+                        # the last client drops the reference
+                        del _SHARED_REPO_CACHE[self.dvc_repo]
+                if not is_shared:
+                    self._repo_cache.temp_dir.cleanup()
+                self._repo_cache = None
 
     def modified_date(
         self,
@@ -374,19 +709,20 @@ class Client:
         :param paths: Paths to query the last modification date (max of dates will be taken)
         :returns: Time of last modification of the given files
         """
-        self._repo_cache = clone_repo(
-            self.dvc_repo, self.temp_path, repo=self._repo_cache
-        )
-        commits = list(
-            self._repo_cache.repo.iter_commits(
-                max_count=100,
-                paths=[f"{file_path}.dvc" for file_path in paths],
+        with self._repo_lock:
+            self._ensure_repo()
+            # Ask git for the single newest commit timestamp directly
+            # instead of materializing commit objects for up to 100
+            # revisions
+            timestamp = self._repo_cache.repo.git.log(
+                "-1",
+                "--format=%ct",
+                "--",
+                *[f"{file_path}.dvc" for file_path in paths],
             )
-        )
-        last_modification_date = datetime.datetime.fromtimestamp(
-            commits[0].committed_date
-        )
-        return last_modification_date
+        if not timestamp:
+            raise DVCFileMissingError(self.dvc_repo, ", ".join(paths))
+        return datetime.datetime.fromtimestamp(int(timestamp))
 
     def download(
         self,
@@ -410,14 +746,62 @@ class Client:
                 duration=time.time() - start,
             )
 
-        file_stats: List[Tuple[str, int]] = []
-        for downloaded_file in downloaded_files:
-            with self.get(
-                downloaded_file.dvc_path, empty_fallback=empty_fallback
-            ) as data_input:
-                content = data_input.read()
-                downloaded_file.write(content)
-                file_stats.append((downloaded_file.dvc_path, len(content)))
+        # Computed once and reused for the sparse prefixes and the
+        # batched pull lanes below
+        dvc_paths = [file.dvc_path for file in downloaded_files]
+        # Materialize the clone and all required subtrees up front so that
+        # worker threads do not mutate the repo cache concurrently
+        prefixes = {os.path.dirname(dvc_path) for dvc_path in dvc_paths}
+        prefixes.discard("")
+        # Split the batched pull into two lanes by the size recorded in
+        # the .dvc metafiles (available before any transfer) so a few
+        # large network transfers do not hold back the long tail of
+        # small files
+        small_batch: List[str] = []
+        large_batch: List[str] = []
+        # The repo lock is held for the whole operation (not just the
+        # setup phase) so no other client sharing this clone can reset
+        # or rewrite the working tree while the workers are reading it
+        with self._repo_lock:
+            self._ensure_repo(path_prefix=next(iter(prefixes), None))
+            for prefix in prefixes:
+                ensure_sparse_path(self._repo_cache, prefix)
+            for dvc_path in dvc_paths:
+                metafile_path = os.path.join(
+                    self._repo_cache.clone_path, f"{dvc_path}.dvc"
+                )
+                if not os.path.isfile(metafile_path):
+                    continue
+                if _metafile_size(metafile_path) >= LARGE_DOWNLOAD_THRESHOLD:
+                    large_batch.append(dvc_path)
+                else:
+                    small_batch.append(dvc_path)
+            # Pull the small files in one DVC invocation instead of
+            # once per file inside the workers
+            self._repo_cache.dvc.pull_paths(small_batch)
+
+            large_paths = set(large_batch)
+            with ThreadPoolExecutor(max_workers=self.jobs) as executor:
+                futures: Dict[int, Any] = {}
+                # Small files start being written out immediately...
+                for index, file in enumerate(downloaded_files):
+                    if file.dvc_path not in large_paths:
+                        futures[index] = executor.submit(
+                            self._download_one, file, empty_fallback
+                        )
+                # ...while the large transfers run alongside them
+                # (the pulls stay sequential - DVC holds a per-repo lock)
+                if large_batch:
+                    self._repo_cache.dvc.pull_paths(large_batch)
+                    for index, file in enumerate(downloaded_files):
+                        if file.dvc_path in large_paths:
+                            futures[index] = executor.submit(
+                                self._download_one, file, empty_fallback
+                            )
+                file_stats: List[Tuple[str, int]] = [
+                    futures[index].result()
+                    for index in range(len(downloaded_files))
+                ]
 
         return DVCDownloadMetadata(
             dvc_repo=self.dvc_repo,
@@ -428,43 +812,124 @@ class Client:
             duration=time.time() - start,
         )
 
+    async def download_async(
+        self,
+        downloaded_files: List[DVCDownload],
+        empty_fallback: bool = False,
+    ) -> DVCDownloadMetadata:
+        """
+        Asynchronous variant of download(...) for asyncio-based callers.
+        The blocking work (git/dvc subprocesses and file I/O) runs in the
+        event loop's default executor so the loop stays responsive while
+        download() parallelizes the per-file work with its own pool.
+
+        :param downloaded_files: Files to be downloaded
+        :param empty_fallback: Create empty file if it does not exists remotely
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            None,
+            functools.partial(
+                self.download, downloaded_files, empty_fallback
+            ),
+        )
+
+    def _download_one(
+        self,
+        downloaded_file: DVCDownload,
+        empty_fallback: bool,
+    ) -> Tuple[str, int]:
+        """
+        Write an already-pulled file to its download target.
+        Executed by the download(...) worker threads after the single
+        batched pull performed by download(...).
+        """
+        local_path = os.path.join(
+            self._repo_cache.clone_path, downloaded_file.dvc_path
+        )
+        if not os.path.isfile(local_path):
+            if empty_fallback:
+                downloaded_file.write("")
+                return (downloaded_file.dvc_path, 0)
+            raise DVCFileMissingError(
+                self.dvc_repo, downloaded_file.dvc_path
+            )
+        with open(local_path, "r") as dvc_file:
+            file_size = downloaded_file.write_from(dvc_file)
+        return (downloaded_file.dvc_path, file_size)
+
+    def prefetch(self, paths: List[str]) -> None:
+        """
+        Pull the given DVC paths into the local clone in a single batched
+        DVC call. Subsequent get(...) reads of those paths are served from
+        the local clone without additional per-file pulls.
+
+        :param paths: DVC paths to be prefetched
+        """
+        if len(paths) == 0:
+            return
+        prefixes = {os.path.dirname(path) for path in paths}
+        prefixes.discard("")
+        with self._repo_lock:
+            self._ensure_repo(path_prefix=next(iter(prefixes), None))
+            for prefix in prefixes:
+                ensure_sparse_path(self._repo_cache, prefix)
+            self._repo_cache.dvc.pull_paths(
+                [
+                    path
+                    for path in paths
+                    if os.path.isfile(
+                        os.path.join(
+                            self._repo_cache.clone_path, f"{path}.dvc"
+                        )
+                    )
+                ]
+            )
+
     def scan_dir(self, path=".") -> List[DVCEntryMetadata]:
         if path.startswith("/"):
             path = path[1:]
-        self._repo_cache = clone_repo(
-            self.dvc_repo, self.temp_path, repo=self._repo_cache
+        with self._repo_lock:
+            return self._scan_dir_locked(path)
+
+    def _scan_dir_locked(self, path: str) -> List[DVCEntryMetadata]:
+        self._ensure_repo(path_prefix=path)
+        search_path = os.path.normpath(
+            os.path.join(self._repo_cache.clone_path, path)
         )
-        search_path = os.path.join(self._repo_cache.clone_path, path)
-        entities = [
-            os.path.join(search_path, entity)
-            for entity in os.listdir(search_path)
-        ]
+        # Every entry path shares the clone-path prefix, so slice it off
+        # once instead of calling os.path.relpath/basename per entry
+        prefix_len = len(self._repo_cache.clone_path) + 1
         filtered_entities: List[DVCEntryMetadata] = []
-        for entity in entities:
-            if (
-                os.path.isdir(entity)
-                and os.path.basename(entity)
-                not in EXCLUDED_GIT_SEARCH_DIRECTORIES
-            ):
-                filtered_entities.append(
-                    DVCEntryMetadata(
-                        path=os.path.relpath(
-                            entity, self._repo_cache.clone_path
-                        ),
-                        name=os.path.basename(entity),
-                        dvc_repo=self.dvc_repo,
-                        is_dir=True,
+        # os.scandir reuses the type information returned by the
+        # directory-read syscall, avoiding a stat() call per entry
+        with os.scandir(search_path) as dir_entries:
+            for entry in dir_entries:
+                if (
+                    entry.is_dir(follow_symlinks=False)
+                    and entry.name not in EXCLUDED_GIT_SEARCH_DIRECTORIES
+                ):
+                    name = entry.name
+                    if len(name) <= INTERNED_NAME_MAX_LENGTH:
+                        name = sys.intern(name)
+                    filtered_entities.append(
+                        DVCEntryMetadata(
+                            path=entry.path[prefix_len:],
+                            name=name,
+                            dvc_repo=self.dvc_repo,
+                            is_dir=True,
+                        )
                     )
-                )
-            elif os.path.isfile(entity) and entity.endswith(".dvc"):
-                filename, file_extension = os.path.splitext(entity)
-                if file_extension == ".dvc":
+                elif entry.is_file() and entry.name.endswith(
+                    DVC_FILE_SUFFIX
+                ):
+                    name = entry.name[:-DVC_FILE_SUFFIX_LEN]
+                    if len(name) <= INTERNED_NAME_MAX_LENGTH:
+                        name = sys.intern(name)
                     filtered_entities.append(
                         DVCEntryMetadata(
-                            path=os.path.relpath(
-                                filename, self._repo_cache.clone_path
-                            ),
-                            name=os.path.basename(filename),
+                            path=entry.path[prefix_len:-DVC_FILE_SUFFIX_LEN],
+                            name=name,
                             dvc_repo=self.dvc_repo,
                             is_dir=False,
                         )
@@ -519,32 +984,31 @@ class Client:
             commit_message = f"{commit_message}\n{commit_message_extra}"
 
         LOGS.dvc_hook.info("Remove files from DVC")
-        self._repo_cache = clone_repo(
-            self.dvc_repo, self.temp_path, repo=self._repo_cache
-        )
-        for file in removed_files:
-            self._repo_cache.dvc.remove(file)
+        # Held for the whole mutation so two clients sharing one clone
+        # cannot interleave their removes/commits on its index
+        with self._repo_lock:
+            self._ensure_repo()
+            for file in removed_files:
+                self._repo_cache.dvc.remove(file)
+
+            LOGS.dvc_hook.info("Push DVC")
+            self._repo_cache.dvc.push()
+
+            try:
+                LOGS.dvc_hook.info("Add DVC removed files to git")
+                repo_add_dvc_files(
+                    self._repo_cache.repo,
+                    removed_files,
+                    delete_mode=True,
+                )
 
-        LOGS.dvc_hook.info("Push DVC")
-        self._repo_cache.dvc.push()
+                LOGS.dvc_hook.info("Commit")
+                commit = self._repo_cache.repo.index.commit(commit_message)
 
-        try:
-            LOGS.dvc_hook.info("Add DVC removed files to git")
-            repo_add_dvc_files(
-                self._repo_cache.repo,
-                [file for file in removed_files],
-                delete_mode=True,
-            )
-
-            LOGS.dvc_hook.info("Commit")
-            commit = self._repo_cache.repo.index.commit(commit_message)
-
-            LOGS.dvc_hook.info("Git push")
-            self._repo_cache.repo.remotes.origin.push()
-        except exc.GitError as e:
-            raise DVCGitUpdateError(
-                self.dvc_repo, [file for file in updated_files], e
-            )
+                LOGS.dvc_hook.info("Git push")
+                self._repo_cache.repo.remotes.origin.push()
+            except exc.GitError as e:
+                raise DVCGitUpdateError(self.dvc_repo, removed_files, e)
 
         return None
 
@@ -569,15 +1033,16 @@ class Client:
         :param commit_message_extra: Optional extra commit message content
         """
         start = time.time()
+        # Computed once and reused below instead of rebuilding the same
+        # list for the commit message, git stage, errors and metadata
+        dvc_paths = [file.dvc_path for file in updated_files]
         if len(updated_files) == 0:
             return DVCUpdateMetadata(
                 dvc_repo=self.dvc_repo,
                 temp_path=self.temp_path,
                 commit_message=None,
                 dvc_files_updated=[],
-                dvc_files_update_requested=[
-                    file.dvc_path for file in updated_files
-                ],
+                dvc_files_update_requested=dvc_paths,
                 commit_hexsha=None,
                 committed_date=None,
                 duration=time.time() - start,
@@ -585,7 +1050,7 @@ class Client:
 
         if commit_message is None:
             file_list_str = ", ".join(
-                [os.path.basename(file.dvc_path) for file in updated_files]
+                [os.path.basename(dvc_path) for dvc_path in dvc_paths]
             )
             commit_message = (
                 f"DVC Automatically updated files: {file_list_str}"
@@ -595,11 +1060,11 @@ class Client:
             commit_message = f"{commit_message}\n{commit_message_extra}"
 
         LOGS.dvc_hook.info("Add files to DVC")
-        self._repo_cache = clone_repo(
-            self.dvc_repo, self.temp_path, repo=self._repo_cache
-        )
-        for file in updated_files:
-            with file as input_file:
+        # Held for the whole mutation so two clients sharing one clone
+        # cannot interleave their adds/commits on its index
+        with self._repo_lock:
+            self._ensure_repo()
+            for file in updated_files:
                 output_dvc_path = os.path.join(
                     self._repo_cache.clone_path, file.dvc_path
                 )
@@ -608,44 +1073,64 @@ class Client:
                 ).mkdir(parents=True, exist_ok=True)
                 # Prevents overwriting the file
                 if file.should_copy_path(os.path.abspath(output_dvc_path)):
-                    with open(output_dvc_path, "w") as out:
-                        out.write(input_file.read())
-            self._repo_cache.dvc.add(file.dvc_path)
+                    file.copy_to(output_dvc_path)
+                self._repo_cache.dvc.add(file.dvc_path)
 
-        LOGS.dvc_hook.info("Push DVC")
-        self._repo_cache.dvc.push()
+            LOGS.dvc_hook.info("Push DVC")
+            self._repo_cache.dvc.push()
 
-        try:
-            LOGS.dvc_hook.info("Add DVC files to git")
-            repo_add_dvc_files(
-                self._repo_cache.repo,
-                [file.dvc_path for file in updated_files],
-            )
+            try:
+                LOGS.dvc_hook.info("Add DVC files to git")
+                repo_add_dvc_files(
+                    self._repo_cache.repo,
+                    dvc_paths,
+                )
 
-            LOGS.dvc_hook.info("Commit")
-            commit = self._repo_cache.repo.index.commit(commit_message)
+                LOGS.dvc_hook.info("Commit")
+                commit = self._repo_cache.repo.index.commit(commit_message)
 
-            LOGS.dvc_hook.info("Git push")
-            self._repo_cache.repo.remotes.origin.push()
-        except exc.GitError as e:
-            raise DVCGitUpdateError(
-                self.dvc_repo, [file.dvc_path for file in updated_files], e
-            )
+                LOGS.dvc_hook.info("Git push")
+                self._repo_cache.repo.remotes.origin.push()
+            except exc.GitError as e:
+                raise DVCGitUpdateError(self.dvc_repo, dvc_paths, e)
 
         meta = DVCUpdateMetadata(
             dvc_repo=self.dvc_repo,
             temp_path=self._repo_cache.temp_dir.name,
             commit_message=commit_message,
-            dvc_files_updated=[file.dvc_path for file in updated_files],
-            dvc_files_update_requested=[
-                file.dvc_path for file in updated_files
-            ],
+            dvc_files_updated=dvc_paths,
+            dvc_files_update_requested=dvc_paths,
             commit_hexsha=commit.hexsha,
             committed_date=commit.committed_date,
             duration=time.time() - start,
         )
         return meta
 
+    async def update_async(
+        self,
+        updated_files: List[DVCUpload],
+        commit_message: Optional[str] = None,
+        commit_message_extra: Optional[str] = None,
+    ) -> DVCUpdateMetadata:
+        """
+        Asynchronous variant of update(...) for asyncio-based callers.
+        The blocking work runs in the event loop's default executor.
+
+        :param updated_files: List of files to be uploaded as DVCUpload objects
+        :param commit_message: Optional GIT commit message
+        :param commit_message_extra: Optional extra commit message content
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            None,
+            functools.partial(
+                self.update,
+                updated_files,
+                commit_message=commit_message,
+                commit_message_extra=commit_message_extra,
+            ),
+        )
+
     def exists(
         self,
         path: str,
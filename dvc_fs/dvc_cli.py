@@ -53,6 +53,11 @@ def get_sys_exit_noop(
     return sys_exit_noop
 
 
+# Cached result of the shell executable check so that 'dvc version' is
+# spawned at most once per process instead of before every command
+_dvc_shell_executable_version: Optional["semantic_version.Version"] = None
+
+
 class DVCLocalCli:
     """
     DVC low-level command interface.
@@ -73,8 +78,12 @@ class DVCLocalCli:
     def _check_dvc_shell_executable() -> semantic_version.Version:
         """
         Check if DVC executable is accessible from the shell.
+        The result is cached for the lifetime of the process.
         Raises dvc_fs.exceptions.DVCMissingExecutableError if the executable is not found.
         """
+        global _dvc_shell_executable_version
+        if _dvc_shell_executable_version is not None:
+            return _dvc_shell_executable_version
         cmd = " ".join(["dvc", "version"])
         p = subprocess.Popen(
             cmd, shell=True, stdout=subprocess.PIPE, stdin=subprocess.PIPE
@@ -97,6 +106,7 @@ class DVCLocalCli:
                     ver,
                     get_config().dvc_version_constraint,
                 )
+            _dvc_shell_executable_version = ver
             return ver
         except ValueError:
             raise DVCMissingExecutableError()
@@ -276,6 +286,19 @@ class DVCLocalCli:
         """
         self._execute_call(["pull", f"'{file_path}'"])
 
+    def pull_paths(self, file_paths: List[str]):
+        """
+        Pull multiple paths from the DVC remote in a single invocation.
+        Batching the paths avoids paying the per-call process-startup
+        and remote-listing overhead once per file.
+        :param file_paths: Paths to be pulled
+        """
+        if len(file_paths) == 0:
+            return
+        self._execute_call(
+            ["pull", *[f"'{file_path}'" for file_path in file_paths]]
+        )
+
     def push(self):
         """
         Push DVC changes upstream.
@@ -14,6 +14,9 @@ except ImportError:
     # flake8: noqa
     from io import StringIO  # # for Python 3
 
+# Chunk size used when streaming downloaded content to a file
+WRITE_CHUNK_SIZE = 64 * 1024
+
 
 class DVCDownload(metaclass=ABCMeta):
     """
@@ -51,6 +54,19 @@ class DVCDownload(metaclass=ABCMeta):
             "Operation is not supported: write() invoked on abstract base class - DVCDownload"
         )
 
+    def write_from(self, source) -> int:
+        """
+        Write data from the given readable file-like object to the target.
+        The default implementation buffers the whole content in memory
+        and delegates to write(). Subclasses writing to files should
+        override this method to stream the content in chunks.
+        :param source: Readable file-like object with the downloaded data
+        :returns: Number of characters written
+        """
+        content = source.read()
+        self.write(content)
+        return len(content)
+
 
 class DVCCallbackDownload(DVCDownload):
     """
@@ -94,3 +110,16 @@ class DVCPathDownload(DVCDownload):
     def write(self, content: str):
         with open(self.src, "w") as out:
             out.write(content)
+
+    def write_from(self, source) -> int:
+        # Stream the content in chunks instead of materializing
+        # the whole file in memory
+        written = 0
+        with open(self.src, "w") as out:
+            while True:
+                chunk = source.read(WRITE_CHUNK_SIZE)
+                if not chunk:
+                    break
+                out.write(chunk)
+                written += len(chunk)
+        return written
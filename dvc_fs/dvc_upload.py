@@ -4,6 +4,7 @@ Abstraction for DVC upload sources.
 """
 import inspect
 import os
+import shutil
 from abc import ABCMeta, abstractmethod
 from typing import Callable, Optional
 
@@ -53,6 +54,18 @@ class DVCUpload(metaclass=ABCMeta):
     def should_copy_path(self, src_path: str):
         return True
 
+    def copy_to(self, dst_path: str) -> None:
+        """
+        Copy the upload content into the given local file.
+        The default implementation streams from the resource returned
+        by open(); subclasses backed by local files can override it
+        with an OS-level copy.
+        :param dst_path: Path of the local file to be written
+        """
+        with self as input_file:
+            with open(dst_path, "w") as out:
+                shutil.copyfileobj(input_file, out)
+
     @abstractmethod
     def describe_source(self) -> str:
         """
@@ -129,6 +142,11 @@ class DVCPathUpload(DVCUpload):
     def should_copy_path(self, src_path: str):
         return os.path.abspath(src_path) != os.path.abspath(self.src)
 
+    def copy_to(self, dst_path: str) -> None:
+        # shutil.copyfile delegates to zero-copy syscalls
+        # (sendfile/copy_file_range) where the platform supports them
+        shutil.copyfile(self.src, dst_path)
+
     def describe_source(self) -> str:
         return f"Path {self.src}"
 